@@ -295,7 +295,7 @@ impl Network {
 
     pub fn setup_recorders(&self, domain: &ModelDomain) -> Result<Vec<Option<Box<dyn Any>>>, PywrError> {
         // Setup recorders
-        let mut recorder_internal_states = Vec::new();
+        let mut recorder_internal_states = Vec::with_capacity(self.recorders.len());
         for recorder in &self.recorders {
             let initial_state = recorder.setup(domain, self)?;
             recorder_internal_states.push(initial_state);
@@ -800,7 +800,9 @@ impl Network {
 
     /// Get a Node from a node's name
     pub fn get_node_index_by_name(&self, name: &str, sub_name: Option<&str>) -> Result<NodeIndex, PywrError> {
-        Ok(self.get_node_by_name(name, sub_name)?.index())
+        self.nodes
+            .get_index_by_name(name, sub_name)
+            .ok_or_else(|| PywrError::NodeNotFound(name.to_string()))
     }
 
     /// Get a Node from a node's index
@@ -810,18 +812,14 @@ impl Network {
 
     /// Get a Node from a node's name
     pub fn get_node_by_name(&self, name: &str, sub_name: Option<&str>) -> Result<&Node, PywrError> {
-        match self.nodes.iter().find(|&n| n.full_name() == (name, sub_name)) {
-            Some(node) => Ok(node),
-            None => Err(PywrError::NodeNotFound(name.to_string())),
-        }
+        let index = self.get_node_index_by_name(name, sub_name)?;
+        self.nodes.get(&index)
     }
 
     /// Get a NodeIndex from a node's name
     pub fn get_mut_node_by_name(&mut self, name: &str, sub_name: Option<&str>) -> Result<&mut Node, PywrError> {
-        match self.nodes.iter_mut().find(|n| n.full_name() == (name, sub_name)) {
-            Some(node) => Ok(node),
-            None => Err(PywrError::NodeNotFound(name.to_string())),
-        }
+        let index = self.get_node_index_by_name(name, sub_name)?;
+        self.nodes.get_mut(&index)
     }
 
     pub fn set_node_cost(
@@ -1729,6 +1727,30 @@ mod tests {
         );
     }
 
+    #[test]
+    /// Test nodes can be found by name and sub-name.
+    fn test_node_name_lookup() {
+        let mut network = Network::default();
+
+        let node = network.add_input_node("my-node", None).unwrap();
+        let sub_node = network.add_link_node("my-node", Some("a")).unwrap();
+
+        assert_eq!(network.get_node_index_by_name("my-node", None), Ok(node));
+        assert_eq!(network.get_node_index_by_name("my-node", Some("a")), Ok(sub_node));
+        assert_eq!(
+            network.get_node_by_name("my-node", Some("a")).unwrap().index(),
+            sub_node
+        );
+        assert_eq!(
+            network.get_node_index_by_name("my-node", Some("b")),
+            Err(PywrError::NodeNotFound("my-node".to_string()))
+        );
+        assert_eq!(
+            network.get_node_index_by_name("other-node", None),
+            Err(PywrError::NodeNotFound("other-node".to_string()))
+        );
+    }
+
     #[test]
     /// Test adding a constant parameter to a network.
     fn test_constant_parameter() {
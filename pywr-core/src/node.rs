@@ -5,6 +5,7 @@ use crate::state::{NodeState, State};
 use crate::timestep::Timestep;
 use crate::virtual_storage::VirtualStorageIndex;
 use crate::PywrError;
+use std::collections::HashMap;
 use std::ops::{Deref, DerefMut};
 
 #[derive(Copy, Clone, Ord, PartialOrd, Eq, PartialEq, Debug)]
@@ -37,6 +38,8 @@ pub enum NodeType {
 #[derive(Default)]
 pub struct NodeVec {
     nodes: Vec<Node>,
+    /// Node indices keyed by name and then sub-name, to avoid searching all the nodes by name.
+    name_index: HashMap<String, Vec<(Option<String>, NodeIndex)>>,
 }
 
 impl Deref for NodeVec {
@@ -62,23 +65,36 @@ impl NodeVec {
         self.nodes.get_mut(index.0).ok_or(PywrError::NodeIndexNotFound)
     }
 
-    pub fn push_new_input(&mut self, name: &str, sub_name: Option<&str>) -> NodeIndex {
-        let node_index = NodeIndex(self.nodes.len());
-        let node = Node::new_input(&node_index, name, sub_name);
+    /// Get the index of a node from its name and sub-name.
+    pub fn get_index_by_name(&self, name: &str, sub_name: Option<&str>) -> Option<NodeIndex> {
+        self.name_index
+            .get(name)?
+            .iter()
+            .find_map(|(s, idx)| (s.as_deref() == sub_name).then_some(*idx))
+    }
+
+    /// Add a node to the end of the vector and the name index.
+    fn push(&mut self, node: Node) -> NodeIndex {
+        let node_index = node.index();
+        self.name_index
+            .entry(node.name().to_string())
+            .or_default()
+            .push((node.sub_name().map(|s| s.to_string()), node_index));
         self.nodes.push(node);
         node_index
     }
+
+    pub fn push_new_input(&mut self, name: &str, sub_name: Option<&str>) -> NodeIndex {
+        let node_index = NodeIndex(self.nodes.len());
+        self.push(Node::new_input(&node_index, name, sub_name))
+    }
     pub fn push_new_link(&mut self, name: &str, sub_name: Option<&str>) -> NodeIndex {
         let node_index = NodeIndex(self.nodes.len());
-        let node = Node::new_link(&node_index, name, sub_name);
-        self.nodes.push(node);
-        node_index
+        self.push(Node::new_link(&node_index, name, sub_name))
     }
     pub fn push_new_output(&mut self, name: &str, sub_name: Option<&str>) -> NodeIndex {
         let node_index = NodeIndex(self.nodes.len());
-        let node = Node::new_output(&node_index, name, sub_name);
-        self.nodes.push(node);
-        node_index
+        self.push(Node::new_output(&node_index, name, sub_name))
     }
 
     pub fn push_new_storage(
@@ -90,9 +106,14 @@ impl NodeVec {
         max_volume: ConstraintValue,
     ) -> NodeIndex {
         let node_index = NodeIndex(self.nodes.len());
-        let node = Node::new_storage(&node_index, name, sub_name, initial_volume, min_volume, max_volume);
-        self.nodes.push(node);
-        node_index
+        self.push(Node::new_storage(
+            &node_index,
+            name,
+            sub_name,
+            initial_volume,
+            min_volume,
+            max_volume,
+        ))
     }
 }
 
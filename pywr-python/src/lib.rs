@@ -135,26 +135,28 @@ fn build_clp_settings(kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<ClpSolverS
     let mut builder = ClpSolverSettingsBuilder::default();
 
     if let Some(kwargs) = kwargs {
-        if let Ok(value) = kwargs.get_item("threads") {
-            if let Some(threads) = value {
-                builder.threads(threads.extract::<usize>()?);
-            }
-            kwargs.del_item("threads")?;
-        }
-
-        if let Ok(value) = kwargs.get_item("parallel") {
-            if let Some(parallel) = value {
-                if parallel.extract::<bool>()? {
-                    builder.parallel();
+        // Read the keyword arguments in a single pass without removing them; the dictionary belongs to the caller.
+        let mut unknown_keys: Vec<String> = Vec::new();
+
+        for (key, value) in kwargs.iter() {
+            let key: String = key.extract()?;
+            match key.as_str() {
+                "threads" => {
+                    builder.threads(value.extract::<usize>()?);
+                }
+                "parallel" => {
+                    if value.extract::<bool>()? {
+                        builder.parallel();
+                    }
                 }
+                _ => unknown_keys.push(key),
             }
-            kwargs.del_item("parallel")?;
         }
 
-        if !kwargs.is_empty() {
+        if !unknown_keys.is_empty() {
             return Err(PyRuntimeError::new_err(format!(
                 "Unknown keyword arguments: {:?}",
-                kwargs
+                unknown_keys
             )));
         }
     }
@@ -167,26 +169,28 @@ fn build_highs_settings(kwargs: Option<&PyDict>) -> PyResult<HighsSolverSettings
     let mut builder = HighsSolverSettingsBuilder::default();
 
     if let Some(kwargs) = kwargs {
-        if let Ok(value) = kwargs.get_item("threads") {
-            if let Some(threads) = value {
-                builder.threads(threads.extract::<usize>()?);
-            }
-            kwargs.del_item("threads")?;
-        }
-
-        if let Ok(value) = kwargs.get_item("parallel") {
-            if let Some(parallel) = value {
-                if parallel.extract::<bool>()? {
-                    builder.parallel();
+        // Read the keyword arguments in a single pass without removing them; the dictionary belongs to the caller.
+        let mut unknown_keys: Vec<String> = Vec::new();
+
+        for (key, value) in kwargs.iter() {
+            let key: String = key.extract()?;
+            match key.as_str() {
+                "threads" => {
+                    builder.threads(value.extract::<usize>()?);
+                }
+                "parallel" => {
+                    if value.extract::<bool>()? {
+                        builder.parallel();
+                    }
                 }
+                _ => unknown_keys.push(key),
             }
-            kwargs.del_item("parallel")?;
         }
 
-        if !kwargs.is_empty() {
+        if !unknown_keys.is_empty() {
             return Err(PyRuntimeError::new_err(format!(
                 "Unknown keyword arguments: {:?}",
-                kwargs
+                unknown_keys
             )));
         }
     }
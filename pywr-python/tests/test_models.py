@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 import pandas
 from pywr import Schema, Model
@@ -16,6 +17,26 @@ def model_dir(test_dir: Path):
     return test_dir / "models"
 
 
+@functools.lru_cache(maxsize=None)
+def read_expected_data(filename: Path) -> pandas.DataFrame:
+    """Read, and cache, the expected outputs of a test model."""
+    return pandas.read_csv(filename, index_col=0, header=[0, 1]).astype("float64")
+
+
+def assert_outputs_allclose(output_fn: Path, expected_data: pandas.DataFrame):
+    """Compare all the expected columns to the model's HDF5 outputs at once."""
+    with h5py.File(output_fn, "r") as fh:
+        simulated = np.stack(
+            [
+                np.squeeze(fh[f"{node}/{attr}"][...])
+                for node, attr in expected_data.columns
+            ],
+            axis=1,
+        )
+
+    np.testing.assert_allclose(simulated, expected_data.to_numpy())
+
+
 def test_simple_timeseries(model_dir: Path, tmpdir: Path):
     """Test the simple model"""
 
@@ -29,14 +50,9 @@ def test_simple_timeseries(model_dir: Path, tmpdir: Path):
 
     assert output_fn.exists()
 
-    expected_data = pandas.read_csv(
-        model_dir / "simple-timeseries" / "expected.csv", index_col=0, header=[0, 1]
-    )
+    expected_data = read_expected_data(model_dir / "simple-timeseries" / "expected.csv")
 
-    with h5py.File(output_fn, "r") as fh:
-        for (node, attr), df in expected_data.items():
-            simulated = np.squeeze(fh[f"{node}/{attr}"])
-            np.testing.assert_allclose(simulated, df)
+    assert_outputs_allclose(output_fn, expected_data)
 
 
 # TODO these tests could be auto-discovered.
@@ -65,11 +81,6 @@ def test_model(model_dir: Path, tmpdir: Path, model_name: str):
     if not expected_fn.exists():
         expected_fn = model_dir / model_name / "expected.csv.gz"
 
-    expected_data = pandas.read_csv(expected_fn, index_col=0, header=[0, 1]).astype(
-        "float64"
-    )
+    expected_data = read_expected_data(expected_fn)
 
-    with h5py.File(output_fn, "r") as fh:
-        for (node, attr), df in expected_data.items():
-            simulated = np.squeeze(fh[f"{node}/{attr}"])
-            np.testing.assert_allclose(simulated, df)
+    assert_outputs_allclose(output_fn, expected_data)
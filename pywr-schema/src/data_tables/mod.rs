@@ -193,7 +193,7 @@ pub struct LoadedTableCollection {
 #[cfg(feature = "core")]
 impl LoadedTableCollection {
     pub fn from_schema(table_defs: Option<&[DataTable]>, data_path: Option<&Path>) -> Result<Self, TableError> {
-        let mut tables = HashMap::new();
+        let mut tables = HashMap::with_capacity(table_defs.map_or(0, |defs| defs.len()));
         if let Some(table_defs) = table_defs {
             for table_def in table_defs {
                 let name = table_def.name().to_string();
@@ -19,6 +19,10 @@ use chrono::{NaiveDate, NaiveDateTime};
 #[cfg(feature = "core")]
 use pywr_core::{models::ModelDomain, timestep::TimestepDuration, PywrError};
 use schemars::JsonSchema;
+#[cfg(feature = "core")]
+use std::borrow::Cow;
+#[cfg(feature = "core")]
+use std::collections::{HashMap, HashSet, VecDeque};
 use std::path::{Path, PathBuf};
 use std::str::FromStr;
 
@@ -388,10 +392,10 @@ impl PywrNetwork {
         };
 
         // Create all the nodes
-        let mut remaining_nodes = self.nodes.clone();
+        let mut remaining_nodes: Vec<&Node> = self.nodes.iter().collect();
 
         while !remaining_nodes.is_empty() {
-            let mut failed_nodes: Vec<Node> = Vec::new();
+            let mut failed_nodes: Vec<&Node> = Vec::new();
             let n = remaining_nodes.len();
             for node in remaining_nodes.into_iter() {
                 if let Err(e) = node.add_to_model(&mut network, &args) {
@@ -418,12 +422,15 @@ impl PywrNetwork {
         }
 
         // Create the edges
+        // Index the nodes by name once, rather than searching the node list for both ends of every edge.
+        let nodes_by_name: HashMap<&str, &Node> = self.nodes.iter().map(|n| (n.name(), n)).collect();
+
         for edge in &self.edges {
-            let from_node = self
-                .get_node_by_name(edge.from_node.as_str())
+            let from_node = nodes_by_name
+                .get(edge.from_node.as_str())
                 .ok_or_else(|| SchemaError::NodeNotFound(edge.from_node.clone()))?;
-            let to_node = self
-                .get_node_by_name(edge.to_node.as_str())
+            let to_node = nodes_by_name
+                .get(edge.to_node.as_str())
                 .ok_or_else(|| SchemaError::NodeNotFound(edge.to_node.clone()))?;
 
             let from_slot = edge.from_slot.as_deref();
@@ -440,14 +447,31 @@ impl PywrNetwork {
         }
 
         // Create all the parameters
-        if let Some(mut remaining_parameters) = self.parameters.clone() {
+        if let Some(parameters) = &self.parameters {
+            // Load in dependency order so that, in general, each parameter loads first time. The retry loop
+            // below remains for any references that are not reported via `VisitMetrics`.
+            let mut remaining_parameters = sort_parameters_by_dependency(parameters);
+
+            let parameter_names: HashSet<&str> = parameters.iter().map(|p| p.name()).collect();
+            let mut loaded_names: HashSet<&str> = HashSet::with_capacity(parameters.len());
+
             while !remaining_parameters.is_empty() {
-                let mut failed_parameters: Vec<Parameter> = Vec::new();
+                let mut failed_parameters: Vec<&Parameter> = Vec::new();
                 let n = remaining_parameters.len();
                 for parameter in remaining_parameters.into_iter() {
-                    if let Err(e) = parameter.add_to_model(&mut network, &args) {
+                    // Don't attempt to add a parameter that references one which is known not to be loaded yet. The
+                    // attempt would only fail part way through.
+                    if has_unloaded_dependency(parameter, &parameter_names, &loaded_names) {
+                        failed_parameters.push(parameter);
+                        continue;
+                    }
+
+                    match parameter.add_to_model(&mut network, &args) {
+                        Ok(_) => {
+                            loaded_names.insert(parameter.name());
+                        }
                         // Adding the parameter failed!
-                        match e {
+                        Err(e) => match e {
                             SchemaError::PywrCore(core_err) => match core_err {
                                 // And it failed because another parameter was not found.
                                 // Let's try to load more parameters and see if this one can tried
@@ -457,7 +481,7 @@ impl PywrNetwork {
                             },
                             SchemaError::ParameterNotFound(_) => failed_parameters.push(parameter),
                             _ => return Err(e),
-                        }
+                        },
                     };
                 }
 
@@ -493,6 +517,89 @@ impl PywrNetwork {
     }
 }
 
+/// Visit the names of the parameters referenced by `parameter` via [`Metric::Parameter`].
+#[cfg(feature = "core")]
+fn visit_parameter_dependencies<F: FnMut(&str)>(parameter: &Parameter, visitor: &mut F) {
+    parameter.visit_metrics(&mut |metric| {
+        if let Metric::Parameter(parameter_ref) = metric {
+            visitor(parameter_ref.name.as_str());
+        }
+    });
+}
+
+/// Returns true if `parameter` references one of `parameter_names` that is not yet in `loaded_names`.
+#[cfg(feature = "core")]
+fn has_unloaded_dependency(
+    parameter: &Parameter,
+    parameter_names: &HashSet<&str>,
+    loaded_names: &HashSet<&str>,
+) -> bool {
+    let mut unloaded = false;
+    visit_parameter_dependencies(parameter, &mut |name| {
+        if parameter_names.contains(name) && !loaded_names.contains(name) {
+            unloaded = true;
+        }
+    });
+    unloaded
+}
+
+/// Order parameters such that each parameter appears after the parameters it references.
+///
+/// Dependencies are found from the [`Metric::Parameter`] references visited by [`VisitMetrics`]
+/// (including those within inline parameters). References to names that are not in `parameters`
+/// are ignored. Parameters without any dependencies keep their original relative order. Any
+/// parameters that could not be ordered (i.e. those in, or depending on, a
+/// circular reference) are appended in their original order; these will fail to load later.
+#[cfg(feature = "core")]
+fn sort_parameters_by_dependency(parameters: &[Parameter]) -> Vec<&Parameter> {
+    let index_by_name: HashMap<&str, usize> = parameters.iter().enumerate().map(|(idx, p)| (p.name(), idx)).collect();
+
+    // The number of unresolved dependencies of each parameter, and the parameters which depend on each parameter.
+    let mut in_degree = vec![0_usize; parameters.len()];
+    let mut dependents: Vec<Vec<usize>> = vec![Vec::new(); parameters.len()];
+
+    for (idx, parameter) in parameters.iter().enumerate() {
+        let mut dependencies: Vec<usize> = Vec::new();
+        visit_parameter_dependencies(parameter, &mut |name| {
+            if let Some(&dep_idx) = index_by_name.get(name) {
+                if !dependencies.contains(&dep_idx) {
+                    dependencies.push(dep_idx);
+                }
+            }
+        });
+
+        in_degree[idx] = dependencies.len();
+        for dep_idx in dependencies {
+            dependents[dep_idx].push(idx);
+        }
+    }
+
+    let mut ready: VecDeque<usize> = (0..parameters.len()).filter(|&idx| in_degree[idx] == 0).collect();
+    let mut sorted = Vec::with_capacity(parameters.len());
+    let mut is_sorted = vec![false; parameters.len()];
+
+    while let Some(idx) = ready.pop_front() {
+        sorted.push(&parameters[idx]);
+        is_sorted[idx] = true;
+
+        for &dependent in &dependents[idx] {
+            in_degree[dependent] -= 1;
+            if in_degree[dependent] == 0 {
+                ready.push_back(dependent);
+            }
+        }
+    }
+
+    sorted.extend(
+        parameters
+            .iter()
+            .zip(is_sorted)
+            .filter_map(|(p, is_sorted)| (!is_sorted).then_some(p)),
+    );
+
+    sorted
+}
+
 #[derive(serde::Deserialize, serde::Serialize, Clone)]
 #[serde(untagged)]
 pub enum PywrNetworkRef {
@@ -758,7 +865,8 @@ impl PywrMultiNetworkModel {
         let domain = ModelDomain::from(timestepper, scenario_collection)?;
         let mut networks = Vec::with_capacity(self.networks.len());
         let mut inter_network_transfers = Vec::new();
-        let mut schemas: Vec<(PywrNetwork, LoadedTableCollection, LoadedTimeseriesCollection)> =
+        // Networks defined inline are borrowed from `self` rather than cloned.
+        let mut schemas: Vec<(Cow<PywrNetwork>, LoadedTableCollection, LoadedTimeseriesCollection)> =
             Vec::with_capacity(self.networks.len());
 
         // First load all the networks
@@ -790,7 +898,7 @@ impl PywrMultiNetworkModel {
                         &network_entry.transfers,
                     )?;
 
-                    (net, network_schema, tables, timeseries)
+                    (net, Cow::Owned(network_schema), tables, timeseries)
                 }
                 PywrNetworkRef::Inline(network_schema) => {
                     let tables = network_schema.load_tables(data_path)?;
@@ -804,7 +912,7 @@ impl PywrMultiNetworkModel {
                         &network_entry.transfers,
                     )?;
 
-                    (net, network_schema.clone(), tables, timeseries)
+                    (net, Cow::Borrowed(network_schema), tables, timeseries)
                 }
             };
 
@@ -982,7 +1090,7 @@ mod tests {
 #[cfg(test)]
 #[cfg(feature = "core")]
 mod core_tests {
-    use super::{PywrModel, PywrMultiNetworkModel};
+    use super::{sort_parameters_by_dependency, PywrModel, PywrMultiNetworkModel};
     use crate::metric::{Metric, ParameterReference};
     use crate::parameters::{AggFunc, AggregatedParameter, ConstantParameter, ConstantValue, Parameter, ParameterMeta};
     use ndarray::{Array1, Array2, Axis};
@@ -1123,6 +1231,55 @@ mod core_tests {
         let _ = schema.build_model(None, None).unwrap();
     }
 
+    /// Test that parameters are sorted such that dependencies come first.
+    #[test]
+    fn test_sort_parameters_by_dependency() {
+        let parameters = vec![
+            Parameter::Aggregated(AggregatedParameter {
+                meta: ParameterMeta {
+                    name: "agg1".to_string(),
+                    comment: None,
+                },
+                agg_func: AggFunc::Sum,
+                metrics: vec![
+                    Metric::Parameter(ParameterReference {
+                        name: "agg2".to_string(),
+                        key: None,
+                    }),
+                    Metric::Parameter(ParameterReference {
+                        name: "p1".to_string(),
+                        key: None,
+                    }),
+                ],
+            }),
+            Parameter::Aggregated(AggregatedParameter {
+                meta: ParameterMeta {
+                    name: "agg2".to_string(),
+                    comment: None,
+                },
+                agg_func: AggFunc::Sum,
+                metrics: vec![Metric::Parameter(ParameterReference {
+                    name: "p1".to_string(),
+                    key: None,
+                })],
+            }),
+            Parameter::Constant(ConstantParameter {
+                meta: ParameterMeta {
+                    name: "p1".to_string(),
+                    comment: None,
+                },
+                value: ConstantValue::Literal(10.0),
+            }),
+        ];
+
+        let sorted: Vec<&str> = sort_parameters_by_dependency(&parameters)
+            .into_iter()
+            .map(|p| p.name())
+            .collect();
+
+        assert_eq!(sorted, vec!["p1", "agg2", "agg1"]);
+    }
+
     /// Test the multi1 model
     #[test]
     fn test_multi1_model() {
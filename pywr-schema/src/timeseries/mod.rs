@@ -109,7 +109,7 @@ impl LoadedTimeseriesCollection {
         domain: &ModelDomain,
         data_path: Option<&Path>,
     ) -> Result<Self, TimeseriesError> {
-        let mut timeseries = HashMap::new();
+        let mut timeseries = HashMap::with_capacity(timeseries_defs.map_or(0, |defs| defs.len()));
         if let Some(timeseries_defs) = timeseries_defs {
             for ts in timeseries_defs {
                 let df = ts.load(domain, data_path)?;